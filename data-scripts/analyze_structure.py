@@ -1,31 +1,75 @@
 #!/usr/bin/env python3
-import json
+import ijson
+from collections import deque
 
-# Load the data
-with open('Opportunity_Zones_-4513523067566272484.geojson', 'r') as f:
-    data = json.load(f)
+# ijson event prefixes for the parts of each MultiPolygon feature
+FEATURE = 'features.item'
+GEOMETRY_TYPE = FEATURE + '.geometry.type'
+PROPERTIES = FEATURE + '.properties'
+PART = FEATURE + '.geometry.coordinates.item'
+RING = PART + '.item'
+COORD = RING + '.item'
+VALUE = COORD + '.item'
 
-print("=== OPPORTUNITY ZONES STRUCTURE ANALYSIS ===")
-print(f"Total features: {len(data['features'])}")
-
-for i, feature in enumerate(data['features']):
+def print_feature(i, feature):
     print(f"\nFeature {i}:")
-    print(f"  Type: {feature['geometry']['type']}")
+    print(f"  Type: {feature['type']}")
     print(f"  Properties: {feature['properties']}")
-    
-    coords = feature['geometry']['coordinates']
-    print(f"  MultiPolygon parts: {len(coords)}")
-    
-    for j, part in enumerate(coords):
+
+    parts = feature['parts']
+    print(f"  MultiPolygon parts: {len(parts)}")
+
+    for j, part in enumerate(parts):
         print(f"    Part {j}: {len(part)} rings")
         for k, ring in enumerate(part):
-            print(f"      Ring {k}: {len(ring)} coordinates")
+            print(f"      Ring {k}: {ring['count']} coordinates")
             if k == 0:  # First ring of first part
-                print(f"      Sample coordinates: {ring[:3]}")
-                print(f"      Last coordinates: {ring[-3:]}")
+                print(f"      Sample coordinates: {ring['head']}")
+                print(f"      Last coordinates: {list(ring['tail'])}")
+
+print("=== OPPORTUNITY ZONES STRUCTURE ANALYSIS ===")
+
+# Stream the parse events so only ring sizes and sample coordinates are kept,
+# never the full coordinate tree
+feature_count = 0
+total_coords = 0
+with open('Opportunity_Zones_-4513523067566272484.geojson', 'rb') as f:
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if prefix == FEATURE:
+            if event == 'start_map':
+                feature = {'type': None, 'properties': None, 'parts': []}
+            elif event == 'end_map':
+                print_feature(feature_count, feature)
+                if feature_count == 0:
+                    total_coords = sum(part[0]['count'] for part in feature['parts'] if part)
+                feature_count += 1
+        elif prefix == GEOMETRY_TYPE:
+            feature['type'] = value
+        elif prefix == PROPERTIES or prefix.startswith(PROPERTIES + '.'):
+            # Properties are small, so build them as a regular object
+            if prefix == PROPERTIES and event not in ('map_key', 'end_map', 'end_array'):
+                properties = ijson.ObjectBuilder()
+            properties.event(event, value)
+            feature['properties'] = properties.value
+        elif prefix == PART and event == 'start_array':
+            feature['parts'].append([])
+        elif prefix == RING and event == 'start_array':
+            ring = {'count': 0, 'head': [], 'tail': deque(maxlen=3)}
+            feature['parts'][-1].append(ring)
+        elif prefix == COORD:
+            if event == 'start_array':
+                coord = []
+            elif event == 'end_array':
+                ring['count'] += 1
+                if len(ring['head']) < 3:
+                    ring['head'].append(coord)
+                ring['tail'].append(coord)
+        elif prefix == VALUE:
+            coord.append(value)
+
+print(f"\nTotal features: {feature_count}")
 
 print("\n=== INTERPRETATION ===")
 print("If each coordinate pair represents a separate zone, then:")
-total_coords = sum(len(part[0]) for part in data['features'][0]['geometry']['coordinates'])
 print(f"Total coordinate pairs: {total_coords}")
-print("But this structure suggests these are boundary vertices, not separate zones.") 
\ No newline at end of file
+print("But this structure suggests these are boundary vertices, not separate zones.")
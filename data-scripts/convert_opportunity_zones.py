@@ -1,51 +1,115 @@
 #!/usr/bin/env python3
 """
 Convert Opportunity Zones GeoJSON from EPSG:2926 to WGS84 coordinates
-for use in Mapbox GL JS.
+for use in Mapbox GL JS, splitting MultiPolygons into individual Polygon
+features in the same pass. Output is newline-delimited GeoJSON (one feature
+per line, WGS84 implied).
+
+This is the only step of the opportunity zones pipeline: it replaces the
+former convert -> opportunity_zones_wgs84.geojson -> split_opportunity_zones.py
+chain, and is the sole producer of opportunity_zones_split.geojsonl.
 """
 
-import json
+import ijson
+from itertools import islice
+import numpy as np
+import orjson
 import pyproj
 from pyproj import Transformer
 import sys
 
-def convert_coordinates():
-    # Read the original GeoJSON
-    with open('Opportunity_Zones_-4513523067566272484.geojson', 'r') as f:
-        geojson = json.load(f)
-    
-    # Create coordinate transformer from EPSG:2926 to WGS84
-    # EPSG:2926 appears to be Washington State Plane Coordinate System
-    transformer = Transformer.from_crs("EPSG:2926", "EPSG:4326", always_xy=True)
-    
-    # Convert coordinates in each feature
-    for feature in geojson['features']:
+# Number of streamed features whose coordinates are transformed per PROJ call
+FEATURE_BATCH_SIZE = 1000
+
+# Never look up transformation grids on the PROJ CDN while transforming
+pyproj.network.set_network_enabled(False)
+
+# Create coordinate transformer from EPSG:2926 to WGS84 once
+# EPSG:2926 appears to be Washington State Plane Coordinate System
+transformer = Transformer.from_crs("EPSG:2926", "EPSG:4326", always_xy=True)
+
+def transform_features(features):
+    """Transform the coordinates of a batch of MultiPolygon features in one PROJ call"""
+    # Collect every ring so all vertices can be transformed together
+    rings = []
+    for feature in features:
         if feature['geometry']['type'] == 'MultiPolygon':
             for polygon in feature['geometry']['coordinates']:
-                for ring in polygon:
-                    for i, coord in enumerate(ring):
-                        # Transform coordinates (x, y) -> (lon, lat)
-                        lon, lat = transformer.transform(coord[0], coord[1])
-                        ring[i] = [lon, lat]
+                rings.extend((polygon, k, ring) for k, ring in enumerate(polygon))
     
-    # Update CRS to WGS84
-    geojson['crs'] = {
-        "type": "name",
-        "properties": {
-            "name": "EPSG:4326"
-        }
-    }
+    if not rings:
+        return
+    
+    offsets = np.cumsum([0] + [len(ring) for _, _, ring in rings])
+    xs = np.fromiter((coord[0] for _, _, ring in rings for coord in ring), dtype=float, count=offsets[-1])
+    ys = np.fromiter((coord[1] for _, _, ring in rings for coord in ring), dtype=float, count=offsets[-1])
+    
+    # Transform coordinates (x, y) -> (lon, lat) on whole arrays, never
+    # per-vertex scalars, so PROJ is entered once per batch
+    lons, lats = transformer.transform(xs, ys)
+    lonlats = np.stack([lons, lats], axis=1)
+    
+    # Scatter the transformed vertices back into their rings as array views;
+    # orjson serializes them directly without a .tolist() round-trip
+    for (polygon, k, _), start, end in zip(rings, offsets[:-1], offsets[1:]):
+        polygon[k] = lonlats[start:end]
+
+def split_feature(feature):
+    """Yield a separate Polygon feature for each polygon in a MultiPolygon feature"""
+    if feature['geometry']['type'] == 'MultiPolygon':
+        # Get the coordinates for each polygon in the MultiPolygon
+        multipolygon_coords = feature['geometry']['coordinates']
+        
+        # Create a separate feature for each polygon
+        for i, polygon_coords in enumerate(multipolygon_coords):
+            yield {
+                "type": "Feature",
+                "id": f"{feature.get('id', 'unknown')}_{i}",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": polygon_coords
+                },
+                "properties": {
+                    **feature.get('properties', {}),
+                    "polygon_index": i,
+                    "total_polygons": len(multipolygon_coords)
+                }
+            }
+    else:
+        # Keep non-MultiPolygon features as-is
+        yield feature
+
+def convert_coordinates():
+    original_count = 0
+    feature_count = 0
+    sample_coords = None
     
-    # Write converted GeoJSON
-    with open('opportunity_zones_wgs84.geojson', 'w') as f:
-        json.dump(geojson, f)
+    # Stream features from the original GeoJSON straight into the split one,
+    # so only a single batch of features is held in memory at a time
+    with open('Opportunity_Zones_-4513523067566272484.geojson', 'rb') as src, \
+            open('opportunity_zones_split.geojsonl', 'wb') as f:
+        features = ijson.items(src, 'features.item', use_float=True)
+        while batch := list(islice(features, FEATURE_BATCH_SIZE)):
+            transform_features(batch)
+            original_count += len(batch)
+            
+            for feature in batch:
+                for new_feature in split_feature(feature):
+                    f.write(orjson.dumps(new_feature, option=orjson.OPT_SERIALIZE_NUMPY))
+                    f.write(b'\n')
+                    
+                    if sample_coords is None:
+                        sample_coords = [float(c) for c in new_feature['geometry']['coordinates'][0][0]]
+                    feature_count += 1
     
     print("✅ Converted opportunity zones to WGS84 coordinates")
-    print("📁 Output: opportunity_zones_wgs84.geojson")
+    print(f"✅ Split MultiPolygon into {feature_count} individual features")
+    print("📁 Output: opportunity_zones_split.geojsonl")
+    print(f"📊 Original features: {original_count}")
+    print(f"📊 New features: {feature_count}")
     
     # Print sample coordinates to verify
-    if geojson['features']:
-        sample_coords = geojson['features'][0]['geometry']['coordinates'][0][0][0]
+    if sample_coords is not None:
         print(f"📍 Sample coordinates: {sample_coords}")
 
 if __name__ == "__main__":
@@ -53,5 +117,5 @@ if __name__ == "__main__":
         convert_coordinates()
     except Exception as e:
         print(f"❌ Error: {e}")
-        print("💡 Make sure pyproj is installed: pip install pyproj")
+        print("💡 Make sure the dependencies are installed: pip install ijson numpy orjson pyproj")
         sys.exit(1) 
\ No newline at end of file
@@ -3,78 +3,168 @@
 Convert QOZs CSV to GeoJSON with all 8,767 opportunity zones
 """
 
-import csv
+import asyncio
 import json
-import requests
+import sqlite3
+import httpx
+import orjson
+import pandas as pd
+from aiolimiter import AsyncLimiter
 from typing import Dict, List, Any
-import time
+
+# TIGERweb request budget: at most 10 requests per second
+MAX_REQUESTS_PER_SECOND = 10
+
+# Number of tracts requested per TIGERweb query
+TRACT_BATCH_SIZE = 200
+
+# Retry/backoff for transient TIGERweb errors and rate limiting
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 0.5
+
+# Local cache of tract boundaries fetched from TIGERweb, keyed by GEOID
+TRACTS_CACHE_PATH = 'tracts_cache.db'
+
+# States included in the QOZ GeoJSON
+VALID_STATES = frozenset({
+    'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 
+    'Delaware', 'Florida', 'Georgia', 'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa',
+    'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts', 'Michigan', 
+    'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire', 
+    'New Jersey', 'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio',
+    'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota', 
+    'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington', 'West Virginia', 
+    'Wisconsin', 'Wyoming'
+})
+
+# Convert state name to FIPS code (simplified mapping)
+STATE_FIPS_MAP = {
+    'Alabama': '01', 'Alaska': '02', 'Arizona': '04', 'Arkansas': '05', 'California': '06',
+    'Colorado': '08', 'Connecticut': '09', 'Delaware': '10', 'Florida': '12', 'Georgia': '13',
+    'Hawaii': '15', 'Idaho': '16', 'Illinois': '17', 'Indiana': '18', 'Iowa': '19',
+    'Kansas': '20', 'Kentucky': '21', 'Louisiana': '22', 'Maine': '23', 'Maryland': '24',
+    'Massachusetts': '25', 'Michigan': '26', 'Minnesota': '27', 'Mississippi': '28', 'Missouri': '29',
+    'Montana': '30', 'Nebraska': '31', 'Nevada': '32', 'New Hampshire': '33', 'New Jersey': '34',
+    'New Mexico': '35', 'New York': '36', 'North Carolina': '37', 'North Dakota': '38', 'Ohio': '39',
+    'Oklahoma': '40', 'Oregon': '41', 'Pennsylvania': '42', 'Rhode Island': '44', 'South Carolina': '45',
+    'South Dakota': '46', 'Tennessee': '47', 'Texas': '48', 'Utah': '49', 'Vermont': '50',
+    'Virginia': '51', 'Washington': '53', 'West Virginia': '54', 'Wisconsin': '55', 'Wyoming': '56'
+}
 
 def load_qozs_csv():
     """Load the QOZs CSV data"""
-    qozs = []
-    valid_states = {
-        'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 
-        'Delaware', 'Florida', 'Georgia', 'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa',
-        'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts', 'Michigan', 
-        'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire', 
-        'New Jersey', 'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio',
-        'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota', 
-        'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington', 'West Virginia', 
-        'Wisconsin', 'Wyoming'
-    }
+    # Read every column as a string so tract IDs keep their leading zeros
+    df = pd.read_csv(
+        'designated-qozs.12.14.18.csv',
+        header=None,
+        names=['state', 'county', 'tract_id', 'zone_type', 'year_range'],
+        usecols=range(5),
+        dtype=str,
+        keep_default_na=False,
+        encoding='utf-8'
+    )
     
-    with open('designated-qozs.12.14.18.csv', 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        for row in reader:
-            # Skip header rows and empty rows, only process rows with valid state names
-            if len(row) >= 5 and row[0] and row[0] in valid_states:
-                state, county, tract_id, zone_type, year_range = row[:5]
-                qozs.append({
-                    'state': state,
-                    'county': county,
-                    'tract_id': tract_id,
-                    'zone_type': zone_type,
-                    'year_range': year_range
-                })
-    return qozs
+    # Skip header rows and empty rows, only keep rows with valid state names
+    df = df[df['state'].isin(VALID_STATES)]
+    return df.to_dict('records')
 
-def get_census_tract_boundary(state_fips: str, tract_id: str):
-    """Get census tract boundary from Census Bureau API"""
+async def get_census_tract_boundaries(client: httpx.AsyncClient, limiter: AsyncLimiter, state_fips: str, tract_ids: List[str]):
+    """Get census tract boundaries for a batch of tracts in one state from Census Bureau API"""
     try:
-        # Convert state name to FIPS code (simplified mapping)
-        state_fips_map = {
-            'Alabama': '01', 'Alaska': '02', 'Arizona': '04', 'Arkansas': '05', 'California': '06',
-            'Colorado': '08', 'Connecticut': '09', 'Delaware': '10', 'Florida': '12', 'Georgia': '13',
-            'Hawaii': '15', 'Idaho': '16', 'Illinois': '17', 'Indiana': '18', 'Iowa': '19',
-            'Kansas': '20', 'Kentucky': '21', 'Louisiana': '22', 'Maine': '23', 'Maryland': '24',
-            'Massachusetts': '25', 'Michigan': '26', 'Minnesota': '27', 'Mississippi': '28', 'Missouri': '29',
-            'Montana': '30', 'Nebraska': '31', 'Nevada': '32', 'New Hampshire': '33', 'New Jersey': '34',
-            'New Mexico': '35', 'New York': '36', 'North Carolina': '37', 'North Dakota': '38', 'Ohio': '39',
-            'Oklahoma': '40', 'Oregon': '41', 'Pennsylvania': '42', 'Rhode Island': '44', 'South Carolina': '45',
-            'South Dakota': '46', 'Tennessee': '47', 'Texas': '48', 'Utah': '49', 'Vermont': '50',
-            'Virginia': '51', 'Washington': '53', 'West Virginia': '54', 'Wisconsin': '55', 'Wyoming': '56'
-        }
-        
-        state_code = state_fips_map.get(state_fips, '00')
+        state_code = STATE_FIPS_MAP.get(state_fips, '00')
         
-        # Use Census Bureau API to get tract boundary
+        # Use Census Bureau API to get all tract boundaries in the batch at once.
+        # Tract IDs in the CSV are full 11-digit GEOIDs.
         url = f"https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb/tigerWMS_ACS2022/MapServer/0/query"
+        geoids = ",".join(f"'{tract_id}'" for tract_id in tract_ids)
         params = {
-            'where': f"STATE='{state_code}' AND TRACT='{tract_id}'",
+            'where': f"STATE='{state_code}' AND GEOID IN ({geoids})",
             'outFields': '*',
             'returnGeometry': 'true',
+            'resultRecordCount': len(tract_ids),
             'f': 'geojson'
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        # POST keeps long WHERE clauses out of the URL
+        for attempt in range(MAX_RETRIES + 1):
+            async with limiter:
+                response = await client.post(url, data=params, timeout=60)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            retry_after = response.headers.get('Retry-After', '')
+            await asyncio.sleep(float(retry_after) if retry_after.isdigit() else BACKOFF_FACTOR * 2 ** attempt)
+        
         if response.status_code == 200:
             data = response.json()
-            if data.get('features'):
-                return data['features'][0]
+            return {
+                feature['properties']['GEOID']: feature
+                for feature in data.get('features', [])
+            }
     except Exception as e:
-        print(f"Error getting boundary for {state_fips} tract {tract_id}: {e}")
+        print(f"Error getting boundaries for {state_fips} tracts {tract_ids[0]}..{tract_ids[-1]}: {e}")
     
-    return None
+    return {}
+
+def open_tracts_cache(path: str = TRACTS_CACHE_PATH):
+    """Open the local tract boundary cache, creating it if needed"""
+    cache = sqlite3.connect(path)
+    cache.execute("CREATE TABLE IF NOT EXISTS tracts (geoid TEXT PRIMARY KEY, geojson BLOB)")
+    return cache
+
+def get_cached_tract_boundary(cache, geoid: str):
+    """Get a census tract boundary from the local cache"""
+    row = cache.execute("SELECT geojson FROM tracts WHERE geoid = ?", (geoid,)).fetchone()
+    return orjson.loads(row[0]) if row else None
+
+def cache_tract_boundaries(cache, boundaries: Dict[str, Any]):
+    """Store a batch of census tract boundaries in the local cache in one transaction"""
+    with cache:
+        cache.executemany(
+            "INSERT OR REPLACE INTO tracts (geoid, geojson) VALUES (?, ?)",
+            [(geoid, orjson.dumps(feature)) for geoid, feature in boundaries.items()]
+        )
+
+async def fetch_census_tract_boundaries(qozs):
+    """Get census tract boundaries for all QOZs, rate limited over a shared HTTP/2 connection pool"""
+    cache = open_tracts_cache()
+    
+    # Reuse boundaries fetched by previous runs
+    boundaries = {}
+    for qoz in qozs:
+        cached = get_cached_tract_boundary(cache, qoz['tract_id'])
+        if cached:
+            boundaries[qoz['tract_id']] = cached
+    print(f"Found {len(boundaries)} tract boundaries in {TRACTS_CACHE_PATH}")
+    
+    # Group the remaining tracts by state and query them in batches
+    tracts_by_state: Dict[str, List[str]] = {}
+    for qoz in qozs:
+        if qoz['tract_id'] not in boundaries:
+            tracts_by_state.setdefault(qoz['state'], []).append(qoz['tract_id'])
+    
+    batches = [
+        (state, tract_ids[i:i + TRACT_BATCH_SIZE])
+        for state, tract_ids in tracts_by_state.items()
+        for i in range(0, len(tract_ids), TRACT_BATCH_SIZE)
+    ]
+    
+    limiter = AsyncLimiter(MAX_REQUESTS_PER_SECOND, 1)
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=MAX_RETRIES)
+    async with httpx.AsyncClient(transport=transport) as client:
+        async def fetch(i, state, tract_ids):
+            batch_boundaries = await get_census_tract_boundaries(client, limiter, state, tract_ids)
+            cache_tract_boundaries(cache, batch_boundaries)
+            print(f"Processed batch {i+1}/{len(batches)}: {state} - {len(batch_boundaries)}/{len(tract_ids)} tracts")
+            return batch_boundaries
+        
+        results = await asyncio.gather(*[fetch(i, state, tract_ids) for i, (state, tract_ids) in enumerate(batches)])
+    
+    cache.close()
+    
+    for result in results:
+        boundaries.update(result)
+    return [boundaries.get(qoz['tract_id']) for qoz in qozs]
 
 def create_qozs_geojson():
     """Create GeoJSON from QOZs CSV data"""
@@ -85,17 +175,12 @@ def create_qozs_geojson():
     features = []
     success_count = 0
     
-    # Process first 100 zones for testing (to avoid overwhelming the API)
-    test_zones = qozs[:100]
+    print(f"Processing {len(qozs)} zones in batches of {TRACT_BATCH_SIZE}...")
     
-    print(f"Processing first {len(test_zones)} zones...")
+    # Get census tract boundaries concurrently
+    boundaries = asyncio.run(fetch_census_tract_boundaries(qozs))
     
-    for i, qoz in enumerate(test_zones):
-        print(f"Processing {i+1}/{len(test_zones)}: {qoz['state']} - {qoz['tract_id']}")
-        
-        # Get census tract boundary
-        boundary = get_census_tract_boundary(qoz['state'], qoz['tract_id'])
-        
+    for i, (qoz, boundary) in enumerate(zip(qozs, boundaries)):
         if boundary:
             # Create feature with QOZ properties
             feature = {
@@ -134,9 +219,6 @@ def create_qozs_geojson():
                 }
             }
             features.append(feature)
-        
-        # Rate limiting
-        time.sleep(0.1)
     
     # Create GeoJSON
     geojson = {
@@ -1,24 +1,43 @@
 import requests
 import csv
+import io
+import itertools
+import shutil
+import tempfile
+import zipfile
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session with retry/backoff on transient errors and rate limiting
+session = requests.Session()
+retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], respect_retry_after_header=True)
+session.mount('http://', HTTPAdapter(max_retries=retry))
+session.mount('https://', HTTPAdapter(max_retries=retry))
 
 def download_and_extract(url):
-    import zipfile, io
-    r = requests.get(url)
-    z = zipfile.ZipFile(io.BytesIO(r.content))
+    # Stream the ZIP to a temporary file instead of holding it in memory
+    with tempfile.TemporaryFile() as tmp:
+        with session.get(url, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+            shutil.copyfileobj(r.raw, tmp)
+        return extract_indicator(zipfile.ZipFile(tmp))
+
+def extract_indicator(z):
     for name in z.namelist():
         if name.endswith('.csv') and 'Metadata' not in name:
             with z.open(name) as f:
-                lines = io.TextIOWrapper(f, encoding='utf-8').readlines()
+                lines = io.TextIOWrapper(f, encoding='utf-8')
                 # Find the header row by looking for 'Country Name' in the line
-                header_idx = None
-                for i, line in enumerate(lines):
-                    if 'country name' in line.lower():
-                        header_idx = i
+                for header in lines:
+                    if 'country name' in header.lower():
                         break
-                if header_idx is None:
+                else:
                     raise Exception('Header row with Country Name not found in CSV')
-                reader = csv.DictReader(lines[header_idx:])
+                reader = csv.DictReader(itertools.chain([header], lines))
                 data = {}
                 country_col = None
                 for col in reader.fieldnames:
@@ -42,35 +61,29 @@ def download_and_extract(url):
 GDP_URL = "http://api.worldbank.org/v2/en/indicator/NY.GDP.MKTP.KD.ZG?downloadformat=csv"
 EMPLOYMENT_URL = "http://api.worldbank.org/v2/en/indicator/SL.UEM.TOTL.ZS?downloadformat=csv"
 
-gdp_growth = download_and_extract(GDP_URL)
-employment_rate = download_and_extract(EMPLOYMENT_URL)
+GEOJSON_URL = "https://raw.githubusercontent.com/datasets/geo-countries/master/data/countries.geojson"
+
+# Fetch both indicators and the country GeoJSON concurrently
+with ThreadPoolExecutor(3) as executor:
+    fut_gdp = executor.submit(download_and_extract, GDP_URL)
+    fut_employment = executor.submit(download_and_extract, EMPLOYMENT_URL)
+    fut_geojson = executor.submit(session.get, GEOJSON_URL, timeout=60)
+    gdp_growth = fut_gdp.result()
+    employment_rate = fut_employment.result()
+    geojson = fut_geojson.result().json()
 
 # Get all country names from the GeoJSON
-geojson_url = "https://raw.githubusercontent.com/datasets/geo-countries/master/data/countries.geojson"
-geojson = requests.get(geojson_url).json()
 countries = [f['properties']['name'].strip().lower() for f in geojson['features']]
 
 today = datetime.today().strftime('%Y-%m-%d')
 
-def null_if_missing(val):
-    return str(val) if val not in ('', None) else 'NULL'
-
-with open('economic_data_global.csv', 'w', newline='') as csvfile:
-    fieldnames = [
-        'region', 'gdp_growth', 'employment_rate', 'property_appreciation',
-        'builder_accessibility', 'international_accessibility', 'last_updated'
-    ]
-    writer = csv.DictWriter(csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL)
-    writer.writeheader()
-    for country in countries:
-        writer.writerow({
-            'region': country,
-            'gdp_growth': null_if_missing(gdp_growth.get(country, '')),
-            'employment_rate': null_if_missing(employment_rate.get(country, '')),
-            'property_appreciation': '',  # Placeholder
-            'builder_accessibility': '',
-            'international_accessibility': '',
-            'last_updated': today
-        })
+df = pd.DataFrame({'region': countries})
+df['gdp_growth'] = df['region'].map(gdp_growth).fillna('NULL')
+df['employment_rate'] = df['region'].map(employment_rate).fillna('NULL')
+df['property_appreciation'] = ''  # Placeholder
+df['builder_accessibility'] = ''
+df['international_accessibility'] = ''
+df['last_updated'] = today
+df.to_csv('economic_data_global.csv', index=False, quoting=csv.QUOTE_MINIMAL, lineterminator='\r\n')
 
 print('CSV generated: economic_data_global.csv')
\ No newline at end of file
@@ -1,29 +1,39 @@
 #!/usr/bin/env python3
 """
-Join QOZ CSV to census tracts shapefile and output a GeoJSON with all QOZ polygons
+Join QOZ CSV to census tracts shapefile and output FlatGeobuf and GeoJSON with all QOZ polygons
 """
 import pandas as pd
-import geopandas as gpd
+import pyogrio
 import json
 
 # Load QOZ CSV
 csv_path = 'designated-qozs.12.14.18.csv'
 colnames = ['STATE', 'COUNTY', 'TRACTCE', 'ZONE_TYPE', 'YEAR_RANGE']
-qozs = pd.read_csv(csv_path, skiprows=7, names=colnames)
+qozs = pd.read_csv(csv_path, skiprows=7, names=colnames, dtype={'TRACTCE': str, 'STATE': str, 'COUNTY': str}, engine='pyarrow')
 
 # Tract numbers in the shapefile are 11 digits, pad with zeros if needed
-qozs['TRACTCE'] = qozs['TRACTCE'].astype(str).str.zfill(11)
+qozs['TRACTCE'] = qozs['TRACTCE'].str.zfill(11)
 
-# Load census tracts shapefile
-tracts = gpd.read_file('cb_2022_us_tract_500k.shp')
+# Find the QOZ census tracts (about a tenth of all tracts) from the attribute table alone
+tracts_path = 'cb_2022_us_tract_500k.shp'
+tract_ids = pyogrio.read_dataframe(tracts_path, columns=['GEOID'], read_geometry=False, fid_as_index=True)
+wanted = tract_ids.index[tract_ids['GEOID'].isin(qozs['TRACTCE'])]
+
+# Load geometries only for those tracts, reading only the columns needed for the merge
+tracts = pyogrio.read_dataframe(tracts_path, columns=['GEOID'], fids=wanted.to_numpy())
 tracts['GEOID'] = tracts['GEOID'].astype(str)
 
 # Merge on GEOID (which is the full 11-digit tract code)
 merged = tracts.merge(qozs, left_on='GEOID', right_on='TRACTCE', how='inner')
 
-# Output as GeoJSON
+# Output as FlatGeobuf, which stores coordinates as typed arrays and streams
+fgb_path = 'opportunity_zones_full.fgb'
+merged.to_file(fgb_path, driver='FlatGeobuf', engine='pyogrio')
+
+# Output as GeoJSON for the Mapbox opportunity zones overlay
 out_path = 'opportunity_zones_full.geojson'
-merged.to_file(out_path, driver='GeoJSON')
+merged.to_file(out_path, driver='GeoJSON', engine='pyogrio')
 
-print(f"✅ Created GeoJSON with {len(merged)} opportunity zones")
+print(f"✅ Created FlatGeobuf and GeoJSON with {len(merged)} opportunity zones")
+print(f"📁 Saved to: {fgb_path}")
 print(f"📁 Saved to: {out_path}") 
\ No newline at end of file